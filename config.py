@@ -6,17 +6,41 @@ Contains configuration parameters and settings for the analysis.
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
 
-# Project paths
-PROJECT_ROOT = Path(__file__).parent
-DATA_DIR = PROJECT_ROOT / 'data'
-OUTPUT_DIR = PROJECT_ROOT / 'outputs'
-SRC_DIR = PROJECT_ROOT / 'src'
+# Project paths (resolved on first use)
+@lru_cache(maxsize=None)
+def project_root():
+    """Get the project root directory."""
+    return Path(__file__).parent
+
+@lru_cache(maxsize=None)
+def data_dir():
+    """Get the input data directory."""
+    return project_root() / 'data'
+
+@lru_cache(maxsize=None)
+def output_dir():
+    """Get the output directory."""
+    return project_root() / 'outputs'
+
+@lru_cache(maxsize=None)
+def src_dir():
+    """Get the source directory."""
+    return project_root() / 'src'
 
 # Data file paths
-HISTORICAL_DATA_PATH = DATA_DIR / 'historical_data.csv'
-SENTIMENT_DATA_PATH = DATA_DIR / 'fear_greed_index.csv'
+@lru_cache(maxsize=None)
+def historical_data_path():
+    """Get the historical trader data path."""
+    return data_dir() / 'historical_data.csv'
+
+@lru_cache(maxsize=None)
+def sentiment_data_path():
+    """Get the fear/greed index data path."""
+    return data_dir() / 'fear_greed_index.csv'
 
 # Analysis parameters
 ANALYSIS_CONFIG = {
@@ -34,14 +58,12 @@ VISUALIZATION_CONFIG = {
     'save_format': 'png',
 }
 
-# Sentiment color mapping
-SENTIMENT_COLORS = {
-    'Extreme Fear': 'darkred',
-    'Fear': 'red',
-    'Neutral': 'gray', 
-    'Greed': 'green',
-    'Extreme Greed': 'darkgreen'
-}
+# Sentiment color mapping, defined once in src.utils (imported on first use)
+@lru_cache(maxsize=None)
+def sentiment_colors():
+    """Get the color used for each sentiment in visualizations."""
+    from src.utils import SENTIMENT_COLORS
+    return SENTIMENT_COLORS
 
 # Required columns for data validation
 REQUIRED_HISTORICAL_COLUMNS = [
@@ -61,36 +83,68 @@ OUTPUT_FILES = {
 }
 
 # Logging configuration
-LOGGING_CONFIG = {
-    'level': 'INFO',
-    'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    'file': OUTPUT_DIR / 'analysis.log'
+@lru_cache(maxsize=None)
+def logging_config():
+    """Get the logging configuration."""
+    return {
+        'level': 'INFO',
+        'format': '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        'file': output_dir() / 'analysis.log'
+    }
+
+# Module-level names kept for backwards compatibility, resolved lazily
+_LAZY_ATTRIBUTES = {
+    'PROJECT_ROOT': project_root,
+    'DATA_DIR': data_dir,
+    'OUTPUT_DIR': output_dir,
+    'SRC_DIR': src_dir,
+    'HISTORICAL_DATA_PATH': historical_data_path,
+    'SENTIMENT_DATA_PATH': sentiment_data_path,
+    'LOGGING_CONFIG': logging_config,
+    'SENTIMENT_COLORS': sentiment_colors,
 }
 
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        return _LAZY_ATTRIBUTES[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+_directories_ensured = False
+
 def ensure_directories():
-    """Ensure all required directories exist."""
-    directories = [DATA_DIR, OUTPUT_DIR]
+    """Ensure all required directories exist (checked once per process)."""
+    global _directories_ensured
+    if _directories_ensured:
+        return
+    directories = [data_dir(), output_dir()]
     for directory in directories:
         directory.mkdir(exist_ok=True)
+    _directories_ensured = True
 
+@lru_cache(maxsize=1)
 def get_config():
-    """Get complete configuration dictionary."""
-    return {
-        'paths': {
-            'project_root': PROJECT_ROOT,
-            'data_dir': DATA_DIR,
-            'output_dir': OUTPUT_DIR,
-            'src_dir': SRC_DIR,
-            'historical_data': HISTORICAL_DATA_PATH,
-            'sentiment_data': SENTIMENT_DATA_PATH,
-        },
-        'analysis': ANALYSIS_CONFIG,
-        'visualization': VISUALIZATION_CONFIG,
-        'sentiment_colors': SENTIMENT_COLORS,
-        'required_columns': {
-            'historical': REQUIRED_HISTORICAL_COLUMNS,
-            'sentiment': REQUIRED_SENTIMENT_COLUMNS,
-        },
-        'output_files': OUTPUT_FILES,
-        'logging': LOGGING_CONFIG,
-    }
\ No newline at end of file
+    """
+    Get complete configuration dictionary.
+    
+    The configuration is built once per process and returned as a read-only
+    mapping, so repeated calls are free and callers cannot mutate it.
+    """
+    return MappingProxyType({
+        'paths': MappingProxyType({
+            'project_root': project_root(),
+            'data_dir': data_dir(),
+            'output_dir': output_dir(),
+            'src_dir': src_dir(),
+            'historical_data': historical_data_path(),
+            'sentiment_data': sentiment_data_path(),
+        }),
+        'analysis': MappingProxyType(ANALYSIS_CONFIG),
+        'visualization': MappingProxyType(VISUALIZATION_CONFIG),
+        'sentiment_colors': MappingProxyType(sentiment_colors()),
+        'required_columns': MappingProxyType({
+            'historical': tuple(REQUIRED_HISTORICAL_COLUMNS),
+            'sentiment': tuple(REQUIRED_SENTIMENT_COLUMNS),
+        }),
+        'output_files': MappingProxyType(OUTPUT_FILES),
+        'logging': MappingProxyType(logging_config()),
+    })
\ No newline at end of file
@@ -9,13 +9,14 @@ import sys
 import os
 from pathlib import Path
 
+import pandas as pd
+
 # Add parent directory to path to import modules
 parent_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(parent_dir))
 
 from src.analyzer import BitcoinSentimentAnalyzer
 from src.data_loader import DataLoader
-from src.visualizer import SentimentVisualizer
 
 def example_1_basic_analysis():
     """
@@ -129,6 +130,7 @@ def example_4_visualizer_only():
         return False
     
     # Initialize visualizer
+    from src.visualizer import SentimentVisualizer
     visualizer = SentimentVisualizer(output_dir='examples/outputs')
     
     # Create different types of visualizations
@@ -158,24 +160,27 @@ def example_5_custom_analysis():
     analyzer.load_data('data/historical_data.csv', 'data/fear_greed_index.csv')
     analyzer.clean_and_prepare_data()
     
-    # Focus on Fear periods only
-    fear_data = analyzer.merged_data[
-        analyzer.merged_data['classification'].str.contains('Fear', na=False)
-    ]
+    # Aggregate every sentiment in one pass, then slice out the Fear periods
+    merged_data = analyzer.merged_data
+    sentiment_analysis = merged_data.groupby('classification', observed=True).agg({
+        'Closed PnL': ['count', 'sum', 'mean'],
+        'Size USD': ['sum', 'mean']
+    })
+    fear_sentiments = sentiment_analysis.index.intersection(['Extreme Fear', 'Fear'])
+    fear_analysis = sentiment_analysis.loc[fear_sentiments]
+    fear_count = int(fear_analysis[('Closed PnL', 'count')].sum())
     
-    print(f"Total records: {len(analyzer.merged_data)}")
-    print(f"Fear-related records: {len(fear_data)}")
+    print(f"Total records: {len(merged_data)}")
+    print(f"Fear-related records: {fear_count}")
     
-    if len(fear_data) > 0:
+    if fear_count > 0:
         # Analyze fear periods specifically
         print("\nFear Period Analysis:")
-        fear_analysis = fear_data.groupby('classification').agg({
-            'Closed PnL': ['count', 'sum', 'mean'],
-            'Size USD': ['sum', 'mean']
-        }).round(2)
-        print(fear_analysis)
+        with pd.option_context('display.float_format', '{:.2f}'.format):
+            print(fear_analysis)
         
         # Create visualization for fear periods only
+        fear_data = merged_data[merged_data['classification'].isin(fear_sentiments)]
         analyzer.visualizer.create_comprehensive_analysis(
             fear_data, 'fear_periods_analysis'
         )
@@ -16,7 +16,6 @@ Version: 1.1.0
 """
 
 import sys
-import os
 from pathlib import Path
 
 # Add src directory to Python path
@@ -24,6 +23,7 @@ src_path = Path(__file__).parent / 'src'
 sys.path.insert(0, str(src_path))
 
 from src.analyzer import BitcoinSentimentAnalyzer
+from src.utils import get_file_stat
 
 def main():
     """
@@ -42,13 +42,15 @@ def main():
     historical_path = 'data/historical_data.csv'
     sentiment_path = 'data/fear_greed_index.csv'
     
-    # Check if data files exist
-    if not os.path.exists(historical_path):
+    # Check if data files exist (the stat results are reused by the loader)
+    historical_stat = get_file_stat(historical_path)
+    if historical_stat is None:
         print(f"Error: Historical data file not found at {historical_path}")
         print("Please ensure the file exists in the data/ directory.")
         return False
     
-    if not os.path.exists(sentiment_path):
+    sentiment_stat = get_file_stat(sentiment_path)
+    if sentiment_stat is None:
         print(f"Error: Sentiment data file not found at {sentiment_path}")
         print("Please ensure the file exists in the data/ directory.")
         return False
@@ -57,7 +59,9 @@ def main():
     success = analyzer.run_complete_analysis(
         historical_path=historical_path,
         sentiment_path=sentiment_path,
-        visualization_type='all'  # Create all types of visualizations
+        visualization_type='all',  # Create all types of visualizations
+        historical_stat=historical_stat,
+        sentiment_stat=sentiment_stat
     )
     
     if success:
@@ -14,11 +14,17 @@ __author__ = "Assignment Solution"
 
 from .analyzer import BitcoinSentimentAnalyzer
 from .data_loader import DataLoader
-from .visualizer import SentimentVisualizer
 from .utils import *
 
 __all__ = [
     'BitcoinSentimentAnalyzer',
     'DataLoader', 
     'SentimentVisualizer'
-]
\ No newline at end of file
+]
+
+def __getattr__(name):
+    # Import the visualizer (and matplotlib) only when it is first requested
+    if name == 'SentimentVisualizer':
+        from .visualizer import SentimentVisualizer
+        return SentimentVisualizer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
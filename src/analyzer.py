@@ -5,16 +5,66 @@ Core Analysis Module
 Main analysis engine for Bitcoin sentiment and trader performance analysis.
 """
 
+import functools
+import importlib
+import io
+import os
+import pickle
+import sys
 import pandas as pd
 import numpy as np
-from .data_loader import DataLoader
-from .visualizer import SentimentVisualizer
+from concurrent.futures import ThreadPoolExecutor
+from .data_loader import DataLoader, CSV_CACHE_VERSION
 from .utils import (
     print_section_header, print_subsection_header, format_currency, 
-    format_percentage, calculate_win_rate, get_performance_summary,
-    suppress_warnings
+    format_percentage, suppress_warnings, sum_and_mean, get_file_stat
 )
 
+# Files written by SentimentVisualizer for each visualization type
+_VISUALIZATION_FILES = {
+    'comprehensive': ['sentiment_analysis_comprehensive.png'],
+    'basic': ['sentiment_analysis_basic.png'],
+    'time_series': ['time_series_analysis.png'],
+}
+_VISUALIZATION_FILES['all'] = [name for names in _VISUALIZATION_FILES.values() for name in names]
+
+# Version of the cached analysis; bump it whenever the analysis or the cached
+# fields change, so older caches are ignored instead of being reused
+ANALYSIS_CACHE_VERSION = 1
+
+# Strategy recommendations that apply regardless of the observed sentiment
+_BASE_STRATEGIES = (
+    "CONTRARIAN STRATEGY: Consider increasing position sizes during 'Extreme Fear' periods if historical data shows recovery patterns.",
+    "MOMENTUM STRATEGY: Reduce exposure during sustained fear periods to minimize downside risk.",
+    "RISK MANAGEMENT: Implement tighter stop-losses during high-volatility sentiment periods.",
+    "POSITION SIZING: Adjust position sizes based on current fear/greed index levels.",
+    "TIMING STRATEGY: Use sentiment extremes as potential entry/exit signals for swing trading."
+)
+
+def _buffered_report(method):
+    """
+    Collect everything a reporting method logs and write it to stdout at once.
+    
+    Report lines go through the analyzer's own buffer rather than a swapped
+    sys.stdout, so output from other threads is neither captured nor
+    interleaved. The text of the most recent report is also kept on the
+    analyzer as `last_report`, so callers can reuse it without capturing stdout.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self._report is not None:
+            return method(self, *args, **kwargs)
+        
+        self._report = io.StringIO()
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.last_report = self._report.getvalue()
+            self._report = None
+            sys.stdout.write(self.last_report)
+            sys.stdout.flush()
+    return wrapper
+
 class BitcoinSentimentAnalyzer:
     """
     Main analyzer for Bitcoin market sentiment and trader performance data.
@@ -30,33 +80,62 @@ class BitcoinSentimentAnalyzer:
         suppress_warnings()
         
         self.data_loader = DataLoader()
-        self.visualizer = SentimentVisualizer(output_dir)
+        self._visualizer = None
         self.output_dir = output_dir
         
         # Data properties
         self.historical_data = None
         self.sentiment_data = None
         self.merged_data = None
+        self.last_report = ''
+        self._report = None
+    
+    def _log(self, *args):
+        """Print to the report being buffered, or to stdout outside of reports."""
+        print(*args, file=self._report)
     
-    def load_data(self, historical_path='data/historical_data.csv', sentiment_path='data/fear_greed_index.csv'):
+    @property
+    def visualizer(self):
+        """Visualizer, created on first use so matplotlib is only imported when plotting."""
+        if self._visualizer is None:
+            from .visualizer import SentimentVisualizer
+            self._visualizer = SentimentVisualizer(self.output_dir)
+        return self._visualizer
+    
+    def load_data(self, historical_path='data/historical_data.csv', sentiment_path='data/fear_greed_index.csv',
+                  historical_stat=None, sentiment_stat=None):
         """
         Load historical trader data and sentiment data.
         
         Args:
             historical_path (str): Path to historical trader data CSV
             sentiment_path (str): Path to fear/greed index CSV
+            historical_stat (os.stat_result): Optional pre-computed stat of historical_path
+            sentiment_stat (os.stat_result): Optional pre-computed stat of sentiment_path
             
         Returns:
             bool: True if successful, False otherwise
         """
         print_section_header("Loading Data")
         
-        # Load historical data
-        if not self.data_loader.load_historical_data(historical_path):
-            return False
-        
-        # Load sentiment data
-        if not self.data_loader.load_sentiment_data(sentiment_path):
+        # Load both datasets concurrently; CSV parsing releases the GIL. Each
+        # loader's messages are collected and printed afterwards in a fixed order
+        historical_messages = []
+        sentiment_messages = []
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            historical_loaded = executor.submit(
+                self.data_loader.load_historical_data, historical_path, historical_stat,
+                log=historical_messages.append
+            )
+            sentiment_loaded = executor.submit(
+                self.data_loader.load_sentiment_data, sentiment_path, sentiment_stat,
+                log=sentiment_messages.append
+            )
+            loaded = historical_loaded.result() and sentiment_loaded.result()
+        
+        for message in historical_messages + sentiment_messages:
+            print(message)
+        if not loaded:
             return False
         
         # Store references
@@ -98,91 +177,122 @@ class BitcoinSentimentAnalyzer:
         print("Data cleaning and preparation completed successfully")
         return True
     
+    @_buffered_report
     def explore_data(self):
         """
         Perform exploratory data analysis.
         """
         if self.merged_data is None or len(self.merged_data) == 0:
-            print("Error: No merged data available. Please run clean_and_prepare_data() first.")
+            self._log("Error: No merged data available. Please run clean_and_prepare_data() first.")
             return
         
-        print_section_header("Exploratory Data Analysis")
+        print_section_header("Exploratory Data Analysis", file=self._report)
         
         # Basic statistics
-        print_subsection_header("1. Dataset Overview")
-        print(f"   - Total merged records: {len(self.merged_data)}")
-        print(f"   - Date range: {self.merged_data['date'].min()} to {self.merged_data['date'].max()}")
-        print(f"   - Unique accounts: {self.merged_data['Account'].nunique()}")
-        print(f"   - Unique symbols: {self.merged_data['Coin'].nunique()}")
+        print_subsection_header("1. Dataset Overview", file=self._report)
+        self._log(f"   - Total merged records: {len(self.merged_data)}")
+        self._log(f"   - Date range: {self.merged_data['date'].min():%Y-%m-%d} to {self.merged_data['date'].max():%Y-%m-%d}")
+        self._log(f"   - Unique accounts: {self.merged_data['Account'].nunique()}")
+        self._log(f"   - Unique symbols: {self.merged_data['Coin'].nunique()}")
         
         # Sentiment distribution
-        print_subsection_header("2. Sentiment Distribution")
-        sentiment_counts = self.merged_data['classification'].value_counts()
-        for sentiment, count in sentiment_counts.items():
-            percentage = (count / len(self.merged_data)) * 100
-            print(f"   - {sentiment}: {count} ({percentage:.1f}%)")
+        print_subsection_header("2. Sentiment Distribution", file=self._report)
+        sentiment_counts = self.merged_data['classification'].value_counts(sort=False)
+        sentiment_counts = sentiment_counts[sentiment_counts > 0]
+        sentiment_pcts = sentiment_counts / sentiment_counts.sum() * 100
+        for sentiment, count, percentage in zip(sentiment_counts.index, sentiment_counts.to_numpy(),
+                                                sentiment_pcts.to_numpy()):
+            self._log(f"   - {sentiment}: {count} ({percentage:.1f}%)")
         
         # Trading statistics
-        print_subsection_header("3. Trading Statistics")
+        print_subsection_header("3. Trading Statistics", file=self._report)
         if 'Closed PnL' in self.merged_data.columns:
-            total_pnl = self.merged_data['Closed PnL'].sum()
-            avg_pnl = self.merged_data['Closed PnL'].mean()
-            print(f"   - Total PnL: {format_currency(total_pnl)}")
-            print(f"   - Average PnL per trade: {format_currency(avg_pnl)}")
+            total_pnl, avg_pnl = sum_and_mean(self.merged_data['Closed PnL'])
+            self._log(f"   - Total PnL: {format_currency(total_pnl)}")
+            self._log(f"   - Average PnL per trade: {format_currency(avg_pnl)}")
             
         if 'Size USD' in self.merged_data.columns:
-            total_volume = self.merged_data['Size USD'].sum()
-            avg_volume = self.merged_data['Size USD'].mean()
-            print(f"   - Total trading volume: {format_currency(total_volume)}")
-            print(f"   - Average trade size: {format_currency(avg_volume)}")
+            total_volume, avg_volume = sum_and_mean(self.merged_data['Size USD'])
+            self._log(f"   - Total trading volume: {format_currency(total_volume)}")
+            self._log(f"   - Average trade size: {format_currency(avg_volume)}")
     
+    @_buffered_report
     def analyze_sentiment_performance_relationship(self):
         """
         Analyze the relationship between market sentiment and trader performance.
         
         Returns:
-            tuple: (sentiment_analysis, win_rates)
+            tuple: (sentiment_analysis, win_rates). sentiment_analysis keeps
+            the original layout: one row per sentiment and ('Closed PnL',
+            'count'/'sum'/'mean'/'std'), ('Size USD', 'sum'/'mean') and
+            ('value', 'mean') columns, rounded to two decimals. win_rates holds
+            the percentage of winning trades per sentiment.
         """
         if self.merged_data is None or len(self.merged_data) == 0:
-            print("Error: No merged data available.")
+            self._log("Error: No merged data available.")
             return None, None
         
-        print_section_header("Sentiment-Performance Relationship Analysis")
-        
-        # Group by sentiment classification
-        sentiment_analysis = self.merged_data.groupby('classification').agg({
-            'Closed PnL': ['count', 'sum', 'mean', 'std'],
-            'Size USD': ['sum', 'mean'],
-            'value': 'mean'
-        }).round(2)
+        print_section_header("Sentiment-Performance Relationship Analysis", file=self._report)
+        
+        # Single grouped pass computing every per-sentiment statistic
+        pnl = self.merged_data['Closed PnL']
+        frame = self.merged_data.assign(
+            win=pnl > 0,
+            gains=pnl.clip(lower=0),
+            losses=-pnl.clip(upper=0)
+        )
+        stats = frame.groupby('classification', observed=True).agg(
+            trades=('Closed PnL', 'size'),
+            count=('Closed PnL', 'count'),
+            total=('Closed PnL', 'sum'),
+            mean=('Closed PnL', 'mean'),
+            std=('Closed PnL', 'std'),
+            max_win=('Closed PnL', 'max'),
+            max_loss=('Closed PnL', 'min'),
+            wins=('win', 'sum'),
+            gains=('gains', 'sum'),
+            losses=('losses', 'sum'),
+            vol=('Size USD', 'sum'),
+            avg_size=('Size USD', 'mean'),
+            value=('value', 'mean')
+        )
+        stats['win_rate'] = stats['wins'] / stats['trades'] * 100
+        stats['profit_factor'] = (
+            stats['gains'] / stats['losses'].where(stats['losses'] > 0)
+        ).fillna(float('inf'))
+        
+        # Report and return the statistics in the original (column, statistic) layout
+        sentiment_analysis = stats[['count', 'total', 'mean', 'std', 'vol', 'avg_size', 'value']].set_axis(
+            pd.MultiIndex.from_tuples([
+                ('Closed PnL', 'count'), ('Closed PnL', 'sum'), ('Closed PnL', 'mean'),
+                ('Closed PnL', 'std'), ('Size USD', 'sum'), ('Size USD', 'mean'), ('value', 'mean')
+            ]),
+            axis=1
+        ).round(2)
         
-        print_subsection_header("1. Performance by Market Sentiment")
-        print(sentiment_analysis)
+        print_subsection_header("1. Performance by Market Sentiment", file=self._report)
+        with pd.option_context('display.float_format', '{:.2f}'.format):
+            self._log(sentiment_analysis)
         
-        # Calculate win rates by sentiment
-        print_subsection_header("2. Win Rates by Sentiment")
-        win_rates = self.merged_data.groupby('classification').apply(
-            lambda x: calculate_win_rate(x['Closed PnL'])
-        ).round(2)
+        # Win rates by sentiment
+        print_subsection_header("2. Win Rates by Sentiment", file=self._report)
+        win_rates = stats['win_rate'].round(2)
         
         for sentiment, rate in win_rates.items():
-            print(f"   - {sentiment}: {format_percentage(rate)}")
+            self._log(f"   - {sentiment}: {format_percentage(rate)}")
         
         # Detailed performance metrics
-        print_subsection_header("3. Detailed Performance Metrics")
-        for sentiment in self.merged_data['classification'].unique():
-            subset = self.merged_data[self.merged_data['classification'] == sentiment]
-            performance = get_performance_summary(subset['Closed PnL'])
-            
-            print(f"\n   {sentiment}:")
-            print(f"     - Total trades: {performance['total_trades']}")
-            print(f"     - Total PnL: {format_currency(performance['total_pnl'])}")
-            print(f"     - Average PnL: {format_currency(performance['avg_pnl'])}")
-            print(f"     - Win rate: {format_percentage(performance['win_rate'])}")
-            print(f"     - Best trade: {format_currency(performance['max_win'])}")
-            print(f"     - Worst trade: {format_currency(performance['max_loss'])}")
-            if performance['profit_factor'] != float('inf'):
-                print(f"     - Profit factor: {performance['profit_factor']:.2f}")
+        print_subsection_header("3. Detailed Performance Metrics", file=self._report)
+        for row in stats.itertuples():
+            self._log(f"\n   {row.Index}:")
+            self._log(f"     - Total trades: {row.trades}")
+            self._log(f"     - Total PnL: {format_currency(row.total)}")
+            self._log(f"     - Average PnL: {format_currency(row.mean)}")
+            self._log(f"     - Win rate: {format_percentage(row.win_rate)}")
+            self._log(f"     - Best trade: {format_currency(row.max_win)}")
+            self._log(f"     - Worst trade: {format_currency(row.max_loss)}")
+            if row.profit_factor != float('inf'):
+                self._log(f"     - Profit factor: {row.profit_factor:.2f}")
         
         return sentiment_analysis, win_rates
     
@@ -210,6 +320,7 @@ class BitcoinSentimentAnalyzer:
         
         print("Visualization creation completed")
     
+    @_buffered_report
     def generate_insights_and_strategies(self):
         """
         Generate insights and trading strategy recommendations.
@@ -218,17 +329,17 @@ class BitcoinSentimentAnalyzer:
             dict: Insights and recommendations
         """
         if self.merged_data is None or len(self.merged_data) == 0:
-            print("Error: No merged data available.")
+            self._log("Error: No merged data available.")
             return None
         
-        print_section_header("Insights and Trading Strategies")
+        print_section_header("Insights and Trading Strategies", file=self._report)
         
         # Calculate key metrics by sentiment
-        sentiment_metrics = self.merged_data.groupby('classification').agg({
+        sentiment_metrics = self.merged_data.groupby('classification', observed=True).agg({
             'Closed PnL': ['mean', 'sum', 'count', 'std'],
             'Size USD': ['sum', 'mean'],
             'value': 'mean'
-        }).round(2)
+        })
         
         # Find best performing sentiment
         avg_pnl_by_sentiment = sentiment_metrics['Closed PnL']['mean']
@@ -253,19 +364,32 @@ class BitcoinSentimentAnalyzer:
             'sentiment_metrics': sentiment_metrics
         }
         
-        print_subsection_header("Key Insights")
-        print(f"   1. BEST PERFORMING SENTIMENT: {best_sentiment} with average PnL of {format_currency(best_avg_pnl)}")
-        print(f"   2. MOST ACTIVE TRADING: {most_active_sentiment} with {most_active_count} trades")
-        print(f"   3. LOWEST RISK SENTIMENT: {lowest_risk_sentiment} with PnL std dev of {format_currency(lowest_risk_std)}")
+        self._print_insights(insights)
+        
+        return insights
+    
+    def _print_insights(self, insights):
+        """
+        Print key insights and the strategy recommendations derived from them.
+        
+        Args:
+            insights (dict): Analysis insights
+        """
+        best_sentiment, best_avg_pnl = insights['best_performing_sentiment']
+        most_active_sentiment, most_active_count = insights['most_active_sentiment']
+        lowest_risk_sentiment, lowest_risk_std = insights['lowest_risk_sentiment']
+        
+        print_subsection_header("Key Insights", file=self._report)
+        self._log(f"   1. BEST PERFORMING SENTIMENT: {best_sentiment} with average PnL of {format_currency(best_avg_pnl)}")
+        self._log(f"   2. MOST ACTIVE TRADING: {most_active_sentiment} with {most_active_count} trades")
+        self._log(f"   3. LOWEST RISK SENTIMENT: {lowest_risk_sentiment} with PnL std dev of {format_currency(lowest_risk_std)}")
         
         # Generate strategy recommendations
-        print_subsection_header("Recommended Trading Strategies")
+        print_subsection_header("Recommended Trading Strategies", file=self._report)
         strategies = self._generate_strategy_recommendations(insights)
         
         for i, strategy in enumerate(strategies, 1):
-            print(f"   {i}. {strategy}")
-        
-        return insights
+            self._log(f"   {i}. {strategy}")
     
     def _generate_strategy_recommendations(self, insights):
         """
@@ -277,19 +401,11 @@ class BitcoinSentimentAnalyzer:
         Returns:
             list: List of strategy recommendations
         """
-        strategies = []
-        
         best_sentiment = insights['best_performing_sentiment'][0]
         most_active_sentiment = insights['most_active_sentiment'][0]
         
         # Base strategies
-        strategies.extend([
-            f"CONTRARIAN STRATEGY: Consider increasing position sizes during 'Extreme Fear' periods if historical data shows recovery patterns.",
-            f"MOMENTUM STRATEGY: Reduce exposure during sustained fear periods to minimize downside risk.",
-            f"RISK MANAGEMENT: Implement tighter stop-losses during high-volatility sentiment periods.",
-            f"POSITION SIZING: Adjust position sizes based on current fear/greed index levels.",
-            f"TIMING STRATEGY: Use sentiment extremes as potential entry/exit signals for swing trading."
-        ])
+        strategies = list(_BASE_STRATEGIES)
         
         # Sentiment-specific strategies
         if 'Fear' in best_sentiment:
@@ -306,14 +422,25 @@ class BitcoinSentimentAnalyzer:
     
     def run_complete_analysis(self, historical_path='data/historical_data.csv', 
                             sentiment_path='data/fear_greed_index.csv',
-                            visualization_type='comprehensive'):
+                            visualization_type='comprehensive',
+                            historical_stat=None, sentiment_stat=None, use_cache=True):
         """
         Run the complete analysis pipeline.
         
+        When use_cache is set, the cleaned and merged data, the insights and
+        the modification times of the saved plots are stored in
+        '<output_dir>/.cache/analysis.pkl'. A later run on the same unchanged
+        input files, whose plots have not been rewritten since, reuses them
+        instead of reloading, re-cleaning and re-plotting. Only the most
+        recent analysis is kept.
+        
         Args:
             historical_path (str): Path to historical data
             sentiment_path (str): Path to sentiment data
             visualization_type (str): Type of visualizations to create
+            historical_stat (os.stat_result): Optional pre-computed stat of historical_path
+            sentiment_stat (os.stat_result): Optional pre-computed stat of sentiment_path
+            use_cache (bool): Whether to reuse and store cached analysis results
             
         Returns:
             bool: True if successful, False otherwise
@@ -321,8 +448,21 @@ class BitcoinSentimentAnalyzer:
         print("Starting Bitcoin Sentiment and Trader Performance Analysis...")
         print("=" * 60)
         
-        # Load data
-        if not self.load_data(historical_path, sentiment_path):
+        cache_key = None
+        if use_cache:
+            cache_key = self._get_cache_key(historical_path, sentiment_path, visualization_type,
+                                            historical_stat, sentiment_stat)
+            if cache_key is not None and self._run_cached_analysis(cache_key):
+                return True
+        
+        # Load data, importing the plotting stack in the background meanwhile;
+        # the visualizer itself, which changes global matplotlib settings, is
+        # still created on this thread when first used
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(importlib.import_module, '.visualizer', __package__)
+            loaded = self.load_data(historical_path, sentiment_path, historical_stat, sentiment_stat)
+        
+        if not loaded:
             print("Failed to load data. Analysis aborted.")
             return False
         
@@ -335,10 +475,112 @@ class BitcoinSentimentAnalyzer:
         self.explore_data()
         self.analyze_sentiment_performance_relationship()
         self.create_visualizations(visualization_type)
-        self.generate_insights_and_strategies()
+        insights = self.generate_insights_and_strategies()
+        
+        if cache_key is not None:
+            self._save_cached_analysis(cache_key, visualization_type, insights)
         
         print("=" * 60)
         print("Analysis completed successfully!")
         print(f"Check '{self.output_dir}/' directory for visualizations.")
         
-        return True
\ No newline at end of file
+        return True
+    
+    @property
+    def _cache_path(self):
+        """File holding the most recent cached analysis for this output directory."""
+        return os.path.join(self.output_dir, '.cache', 'analysis.pkl')
+    
+    def _get_cache_key(self, historical_path, sentiment_path, visualization_type,
+                       historical_stat=None, sentiment_stat=None):
+        """
+        Get the key identifying an analysis of the given inputs by their size
+        and mtime, the cache versions and the pandas and NumPy versions.
+        
+        Returns:
+            tuple: Cache key, or None if an input file is missing
+        """
+        historical_stat = historical_stat or get_file_stat(historical_path)
+        sentiment_stat = sentiment_stat or get_file_stat(sentiment_path)
+        if historical_stat is None or sentiment_stat is None:
+            return None
+        
+        return (
+            ANALYSIS_CACHE_VERSION, CSV_CACHE_VERSION, pd.__version__, np.__version__,
+            os.path.abspath(historical_path), historical_stat.st_size, historical_stat.st_mtime_ns,
+            os.path.abspath(sentiment_path), sentiment_stat.st_size, sentiment_stat.st_mtime_ns,
+            visualization_type
+        )
+    
+    def _run_cached_analysis(self, cache_key):
+        """
+        Report a previous analysis from the cache, if it matches cache_key and
+        the plots it saved have not been rewritten since.
+        
+        Returns:
+            bool: True if the cached analysis was used, False otherwise
+        """
+        # Pickles written by other pandas or NumPy versions can fail to load
+        # in many ways; any failure just means the analysis is rerun
+        try:
+            cached = pd.read_pickle(self._cache_path)
+        except Exception:
+            return False
+        
+        if not isinstance(cached, dict) or cached.get('key') != cache_key:
+            return False
+        
+        for path, mtime_ns in cached['plots'].items():
+            stat_result = get_file_stat(path)
+            if stat_result is None or stat_result.st_mtime_ns != mtime_ns:
+                return False
+        
+        print(f"Input data unchanged, reusing cached analysis from '{self._cache_path}'")
+        self.historical_data = self.data_loader.historical_data = cached['historical_data']
+        self.sentiment_data = self.data_loader.sentiment_data = cached['sentiment_data']
+        self.merged_data = self.data_loader.merged_data = cached['merged_data']
+        
+        self.explore_data()
+        self.analyze_sentiment_performance_relationship()
+        
+        print_section_header("Insights and Trading Strategies")
+        self._print_insights(cached['insights'])
+        
+        print("=" * 60)
+        print("Analysis completed successfully!")
+        print(f"Check '{self.output_dir}/' directory for visualizations.")
+        
+        return True
+    
+    def _save_cached_analysis(self, cache_key, visualization_type, insights):
+        """
+        Store the analysis under cache_key, replacing any previously cached one.
+        
+        Nothing is stored if one of the expected plots was not written.
+        """
+        plots = {}
+        for name in _VISUALIZATION_FILES.get(visualization_type, []):
+            path = os.path.join(self.output_dir, name)
+            stat_result = get_file_stat(path)
+            if stat_result is None:
+                return
+            plots[path] = stat_result.st_mtime_ns
+        
+        cached = {
+            'key': cache_key,
+            'plots': plots,
+            'historical_data': self.historical_data,
+            'sentiment_data': self.sentiment_data,
+            'merged_data': self.merged_data,
+            'insights': insights,
+        }
+        
+        # Write to a temporary file first so a failed write never leaves a
+        # truncated cache behind
+        temp_path = f"{self._cache_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self._cache_path), exist_ok=True)
+            pd.to_pickle(cached, temp_path, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self._cache_path)
+        except OSError as e:
+            print(f"Warning: Could not write analysis cache: {e}")
\ No newline at end of file
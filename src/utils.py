@@ -10,34 +10,74 @@ import numpy as np
 from datetime import datetime
 import warnings
 
+# Compile the numeric kernels at the bottom of this module with Numba when it
+# is installed; without it they run as plain vectorized NumPy
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the decorated function as is."""
+        return lambda func: func
+
+# Ordered sentiment categories, from most fearful to most greedy
+SENTIMENT_CATEGORIES = pd.CategoricalDtype(
+    ['Extreme Fear', 'Fear', 'Neutral', 'Greed', 'Extreme Greed'], ordered=True
+)
+
 def suppress_warnings():
     """Suppress common warnings for cleaner output."""
     warnings.filterwarnings('ignore')
 
+# Bound format methods, so the format spec is parsed once rather than per call
+_CURRENCY_FORMAT = '${:,.2f}'.format
+_PERCENTAGE_FORMAT = '{:.1f}%'.format
+
 def format_currency(amount):
     """Format amount as currency string."""
-    return f"${amount:,.2f}"
+    return _CURRENCY_FORMAT(amount)
 
 def format_percentage(value):
     """Format value as percentage string."""
-    return f"{value:.1f}%"
+    return _PERCENTAGE_FORMAT(value)
+
+def sum_and_mean(series):
+    """Get the NaN-skipping sum and mean of a numeric series, sharing one NaN mask between both."""
+    values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+    valid = ~np.isnan(values)
+    count = np.count_nonzero(valid)
+    total = np.add.reduce(values, where=valid)
+    return total, (total / count if count else np.nan)
 
 def calculate_win_rate(pnl_series):
     """Calculate win rate from PnL series."""
-    if len(pnl_series) == 0:
-        return 0.0
-    return (pnl_series > 0).sum() / len(pnl_series) * 100
+    return _win_rate_kernel(np.asarray(pnl_series, dtype=np.float64))
+
+# Colors used for each sentiment in visualizations
+SENTIMENT_COLORS = {
+    'Extreme Fear': 'darkred',
+    'Fear': 'red', 
+    'Neutral': 'gray',
+    'Greed': 'green',
+    'Extreme Greed': 'darkgreen'
+}
+
+# Sentiment colors aligned with SENTIMENT_CATEGORIES; the trailing 'gray' is
+# picked by the -1 code of missing or unknown sentiments
+SENTIMENT_COLOR_ARR = np.array(
+    [SENTIMENT_COLORS[s] for s in SENTIMENT_CATEGORIES.categories] + ['gray']
+)
 
 def get_sentiment_color(sentiment):
     """Get color for sentiment visualization."""
-    color_map = {
-        'Extreme Fear': 'darkred',
-        'Fear': 'red', 
-        'Neutral': 'gray',
-        'Greed': 'green',
-        'Extreme Greed': 'darkgreen'
-    }
-    return color_map.get(sentiment, 'gray')
+    return SENTIMENT_COLORS.get(sentiment, 'gray')
+
+def get_sentiment_colors(sentiments):
+    """Get an array of colors for a sequence of sentiments by indexing SENTIMENT_COLOR_ARR."""
+    if getattr(sentiments, 'dtype', None) == SENTIMENT_CATEGORIES:
+        codes = pd.Categorical(sentiments).codes
+    else:
+        codes = SENTIMENT_CATEGORIES.categories.get_indexer(sentiments)
+    return SENTIMENT_COLOR_ARR[codes]
 
 def validate_required_columns(df, required_columns, data_type="data"):
     """Validate that dataframe has required columns."""
@@ -54,15 +94,15 @@ def safe_numeric_conversion(series, column_name):
         print(f"Warning: Could not convert {column_name} to numeric: {e}")
         return series
 
-def print_section_header(title):
+def print_section_header(title, file=None):
     """Print formatted section header."""
-    print("\n" + "="*50)
-    print(title.upper())
-    print("="*50)
+    print("\n" + "="*50, file=file)
+    print(title.upper(), file=file)
+    print("="*50, file=file)
 
-def print_subsection_header(title):
+def print_subsection_header(title, file=None):
     """Print formatted subsection header."""
-    print(f"\n{title}:")
+    print(f"\n{title}:", file=file)
 
 def create_output_directory(path):
     """Create output directory if it doesn't exist."""
@@ -71,17 +111,24 @@ def create_output_directory(path):
         os.makedirs(path)
         print(f"Created output directory: {path}")
 
+def get_file_stat(path):
+    """Stat a path once, returning the stat result for regular files or None."""
+    import os
+    import stat
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st if stat.S_ISREG(st.st_mode) else None
+
 def get_date_range_string(start_date, end_date):
     """Get formatted date range string."""
     return f"{start_date} to {end_date}"
 
 def calculate_sharpe_ratio(returns, risk_free_rate=0.02):
     """Calculate Sharpe ratio for returns series."""
-    if len(returns) == 0 or returns.std() == 0:
-        return 0.0
-    
-    excess_returns = returns.mean() - risk_free_rate/252  # Daily risk-free rate
-    return excess_returns / returns.std() * np.sqrt(252)  # Annualized
+    values = np.asarray(returns, dtype=np.float64)
+    return _sharpe_kernel(values[~np.isnan(values)], float(risk_free_rate))
 
 def get_performance_summary(pnl_series):
     """Get comprehensive performance summary."""
@@ -96,18 +143,47 @@ def get_performance_summary(pnl_series):
             'profit_factor': 0
         }
     
-    winning_trades = pnl_series[pnl_series > 0]
-    losing_trades = pnl_series[pnl_series < 0]
+    # Work on the raw values; NaNs count as trades but are skipped in the statistics
+    pnl = np.asarray(pnl_series, dtype=np.float64)
+    valid = pnl[~np.isnan(pnl)]
+    wins = valid > 0
     
-    total_wins = winning_trades.sum() if len(winning_trades) > 0 else 0
-    total_losses = abs(losing_trades.sum()) if len(losing_trades) > 0 else 0
+    total_pnl = valid.sum()
+    total_wins = valid.sum(where=wins)
+    total_losses = -valid.sum(where=valid < 0)
     
     return {
-        'total_trades': len(pnl_series),
-        'total_pnl': pnl_series.sum(),
-        'avg_pnl': pnl_series.mean(),
-        'win_rate': calculate_win_rate(pnl_series),
-        'max_win': pnl_series.max(),
-        'max_loss': pnl_series.min(),
+        'total_trades': pnl.size,
+        'total_pnl': total_pnl,
+        'avg_pnl': total_pnl / valid.size if valid.size else np.nan,
+        'win_rate': np.count_nonzero(wins) / pnl.size * 100,
+        'max_win': valid.max() if valid.size else np.nan,
+        'max_loss': valid.min() if valid.size else np.nan,
         'profit_factor': total_wins / total_losses if total_losses > 0 else float('inf')
-    }
\ No newline at end of file
+    }
+
+
+@njit(cache=True)
+def _win_rate_kernel(pnl):
+    """Percentage of positive values in a float64 array."""
+    if pnl.size == 0:
+        return 0.0
+    return (pnl > 0).sum() / pnl.size * 100
+
+
+@njit(cache=True)
+def _sharpe_kernel(returns, risk_free_rate):
+    """Annualized Sharpe ratio of a NaN-free float64 array of daily returns."""
+    n = returns.size
+    if n == 0:
+        return 0.0
+    if n == 1:
+        return np.nan
+    
+    mean = returns.mean()
+    std = np.sqrt(((returns - mean) ** 2).sum() / (n - 1))  # Sample std, as pandas
+    if std == 0:
+        return 0.0
+    
+    excess_returns = mean - risk_free_rate / 252  # Daily risk-free rate
+    return excess_returns / std * np.sqrt(252)  # Annualized
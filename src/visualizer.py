@@ -7,9 +7,16 @@ Creates comprehensive visualizations for sentiment analysis results.
 
 import matplotlib.pyplot as plt
 import seaborn as sns
+from matplotlib.lines import Line2D
 import pandas as pd
 import numpy as np
-from .utils import get_sentiment_color, format_currency, format_percentage, create_output_directory
+from .utils import (
+    get_sentiment_color, get_sentiment_colors, format_currency, format_percentage,
+    create_output_directory
+)
+
+# Scatter plots draw a fixed-seed random sample of at most this many points
+SCATTER_MAX_POINTS = 20000
 
 class SentimentVisualizer:
     """
@@ -29,14 +36,26 @@ class SentimentVisualizer:
         # Set plotting style
         plt.style.use('default')
         sns.set_palette("husl")
+        
+        # Simplify long paths and draw them in chunks so dense line and
+        # scatter plots render quickly
+        plt.rcParams.update({
+            'path.simplify': True,
+            'path.simplify_threshold': 1.0,
+            'agg.path.chunksize': 10000,
+            'figure.dpi': 100,
+        })
     
-    def create_comprehensive_analysis(self, merged_data, save_name='sentiment_analysis_comprehensive'):
+    def create_comprehensive_analysis(self, merged_data, save_name='sentiment_analysis_comprehensive',
+                                      close_after_save=True):
         """
         Create comprehensive analysis visualizations.
         
         Args:
             merged_data (pd.DataFrame): Merged dataset
             save_name (str): Name for saved file
+            close_after_save (bool): Close the figure once saved so repeated
+                calls do not accumulate open figures
         """
         if merged_data is None or len(merged_data) == 0:
             print("Error: No data available for visualization")
@@ -49,20 +68,23 @@ class SentimentVisualizer:
         fig.suptitle('Bitcoin Market Sentiment vs Trader Performance Analysis', 
                     fontsize=16, fontweight='bold', y=0.98)
         
+        # Aggregate every per-sentiment metric in a single grouped pass
+        sentiment_stats = self._aggregate_by_sentiment(merged_data)
+        
         # 1. Total PnL by Sentiment
-        self._plot_total_pnl_by_sentiment(merged_data, axes[0, 0])
+        self._plot_total_pnl_by_sentiment(sentiment_stats['total_pnl'], axes[0, 0])
         
         # 2. Average PnL by Sentiment  
-        self._plot_average_pnl_by_sentiment(merged_data, axes[0, 1])
+        self._plot_average_pnl_by_sentiment(sentiment_stats['avg_pnl'], axes[0, 1])
         
         # 3. Trade Count by Sentiment
-        self._plot_trade_count_by_sentiment(merged_data, axes[0, 2])
+        self._plot_trade_count_by_sentiment(sentiment_stats['count'], axes[0, 2])
         
         # 4. Trading Volume by Sentiment
-        self._plot_volume_by_sentiment(merged_data, axes[1, 0])
+        self._plot_volume_by_sentiment(sentiment_stats['volume'], axes[1, 0])
         
         # 5. Win Rate by Sentiment
-        self._plot_win_rate_by_sentiment(merged_data, axes[1, 1])
+        self._plot_win_rate_by_sentiment(sentiment_stats['wins'] / sentiment_stats['count'] * 100, axes[1, 1])
         
         # 6. PnL vs Fear/Greed Scatter
         self._plot_pnl_vs_sentiment_scatter(merged_data, axes[1, 2])
@@ -71,18 +93,23 @@ class SentimentVisualizer:
         
         # Save the plot
         save_path = f"{self.output_dir}/{save_name}.png"
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        plt.savefig(save_path, dpi=150)
         print(f"Comprehensive analysis saved as '{save_path}'")
+        if close_after_save:
+            plt.close(fig)
         
         return fig
     
-    def create_basic_analysis(self, merged_data, save_name='sentiment_analysis_basic'):
+    def create_basic_analysis(self, merged_data, save_name='sentiment_analysis_basic',
+                              close_after_save=True):
         """
         Create basic analysis visualizations (original format).
         
         Args:
             merged_data (pd.DataFrame): Merged dataset
             save_name (str): Name for saved file
+            close_after_save (bool): Close the figure once saved so repeated
+                calls do not accumulate open figures
         """
         if merged_data is None or len(merged_data) == 0:
             print("Error: No data available for visualization")
@@ -97,7 +124,7 @@ class SentimentVisualizer:
         
         # 1. PnL Distribution by Sentiment
         ax1 = axes[0, 0]
-        sentiment_pnl = merged_data.groupby('classification')['Closed PnL'].sum()
+        sentiment_pnl = merged_data.groupby('classification', observed=True)['Closed PnL'].sum()
         if len(sentiment_pnl) > 0:
             colors = ['red' if 'Fear' in str(idx) else 'green' for idx in sentiment_pnl.index]
             sentiment_pnl.plot(kind='bar', ax=ax1, color=colors, alpha=0.7)
@@ -109,7 +136,7 @@ class SentimentVisualizer:
         
         # 2. Trading Volume by Sentiment
         ax2 = axes[0, 1]
-        sentiment_volume = merged_data.groupby('classification')['Size USD'].sum()
+        sentiment_volume = merged_data.groupby('classification', observed=True)['Size USD'].sum()
         if len(sentiment_volume) > 0:
             sentiment_volume.plot(kind='bar', ax=ax2, color='blue', alpha=0.7)
             ax2.set_title('Trading Volume by Market Sentiment')
@@ -130,21 +157,7 @@ class SentimentVisualizer:
             ax3.text(0.5, 0.5, 'No data available', ha='center', va='center', transform=ax3.transAxes)
         
         # 4. PnL vs Fear/Greed Index Scatter
-        ax4 = axes[1, 1]
-        if len(merged_data) > 0:
-            scatter_colors = {'Fear': 'red', 'Extreme Fear': 'darkred', 'Greed': 'green', 'Extreme Greed': 'darkgreen'}
-            for sentiment in merged_data['classification'].unique():
-                data = merged_data[merged_data['classification'] == sentiment]
-                ax4.scatter(data['value'], data['Closed PnL'], 
-                           label=sentiment, alpha=0.6, 
-                           color=scatter_colors.get(sentiment, 'gray'))
-            
-            ax4.set_title('PnL vs Fear/Greed Index')
-            ax4.set_xlabel('Fear/Greed Index')
-            ax4.set_ylabel('Closed PnL ($)')
-            ax4.legend()
-        else:
-            ax4.text(0.5, 0.5, 'No data available', ha='center', va='center', transform=ax4.transAxes)
+        self._plot_pnl_vs_sentiment_scatter(merged_data, axes[1, 1])
         
         plt.tight_layout(rect=[0, 0.03, 1, 0.95])
         
@@ -152,62 +165,76 @@ class SentimentVisualizer:
         save_path = f"{self.output_dir}/{save_name}.png"
         plt.savefig(save_path, dpi=300, bbox_inches='tight')
         print(f"Basic analysis saved as '{save_path}'")
+        if close_after_save:
+            plt.close(fig)
         
         return fig
     
-    def _plot_total_pnl_by_sentiment(self, data, ax):
+    def _aggregate_by_sentiment(self, data):
+        """
+        Aggregate the metrics plotted per sentiment.
+        
+        Args:
+            data (pd.DataFrame): Merged dataset
+            
+        Returns:
+            pd.DataFrame: Total/average PnL, volume, trade count and winning
+                trade count, indexed by sentiment
+        """
+        return data.assign(win=data['Closed PnL'].gt(0)).groupby('classification', observed=True).agg(
+            total_pnl=('Closed PnL', 'sum'),
+            avg_pnl=('Closed PnL', 'mean'),
+            volume=('Size USD', 'sum'),
+            count=('Closed PnL', 'size'),
+            wins=('win', 'sum')
+        )
+    
+    def _plot_total_pnl_by_sentiment(self, sentiment_pnl, ax):
         """Plot total PnL by sentiment."""
-        sentiment_pnl = data.groupby('classification')['Closed PnL'].sum()
         if len(sentiment_pnl) > 0:
-            colors = [get_sentiment_color(sentiment) for sentiment in sentiment_pnl.index]
+            colors = get_sentiment_colors(sentiment_pnl.index)
             bars = sentiment_pnl.plot(kind='bar', ax=ax, color=colors, alpha=0.7)
             ax.set_title('Total PnL by Market Sentiment')
             ax.set_ylabel('Total PnL ($)')
             ax.tick_params(axis='x', rotation=45)
             
             # Add value labels on bars
-            for i, v in enumerate(sentiment_pnl.values):
-                ax.text(i, v + (max(sentiment_pnl.values) * 0.01), 
-                       format_currency(v), ha='center', va='bottom')
+            ax.bar_label(ax.containers[-1], labels=sentiment_pnl.map(format_currency).tolist(),
+                        padding=3)
         else:
             ax.text(0.5, 0.5, 'No data available', ha='center', va='center', transform=ax.transAxes)
     
-    def _plot_average_pnl_by_sentiment(self, data, ax):
+    def _plot_average_pnl_by_sentiment(self, sentiment_avg_pnl, ax):
         """Plot average PnL by sentiment."""
-        sentiment_avg_pnl = data.groupby('classification')['Closed PnL'].mean()
         if len(sentiment_avg_pnl) > 0:
-            colors = [get_sentiment_color(sentiment) for sentiment in sentiment_avg_pnl.index]
+            colors = get_sentiment_colors(sentiment_avg_pnl.index)
             sentiment_avg_pnl.plot(kind='bar', ax=ax, color=colors, alpha=0.7)
             ax.set_title('Average PnL per Trade by Sentiment')
             ax.set_ylabel('Average PnL ($)')
             ax.tick_params(axis='x', rotation=45)
             
             # Add value labels
-            for i, v in enumerate(sentiment_avg_pnl.values):
-                ax.text(i, v + (max(sentiment_avg_pnl.values) * 0.01), 
-                       format_currency(v), ha='center', va='bottom')
+            ax.bar_label(ax.containers[-1], labels=sentiment_avg_pnl.map(format_currency).tolist(),
+                        padding=3)
         else:
             ax.text(0.5, 0.5, 'No data available', ha='center', va='center', transform=ax.transAxes)
     
-    def _plot_trade_count_by_sentiment(self, data, ax):
+    def _plot_trade_count_by_sentiment(self, trade_counts, ax):
         """Plot trade count by sentiment."""
-        trade_counts = data['classification'].value_counts()
         if len(trade_counts) > 0:
-            colors = [get_sentiment_color(sentiment) for sentiment in trade_counts.index]
+            colors = get_sentiment_colors(trade_counts.index)
             trade_counts.plot(kind='bar', ax=ax, color=colors, alpha=0.7)
             ax.set_title('Number of Trades by Sentiment')
             ax.set_ylabel('Number of Trades')
             ax.tick_params(axis='x', rotation=45)
             
             # Add value labels
-            for i, v in enumerate(trade_counts.values):
-                ax.text(i, v + 0.1, f'{v}', ha='center', va='bottom')
+            ax.bar_label(ax.containers[-1], padding=3)
         else:
             ax.text(0.5, 0.5, 'No data available', ha='center', va='center', transform=ax.transAxes)
     
-    def _plot_volume_by_sentiment(self, data, ax):
+    def _plot_volume_by_sentiment(self, sentiment_volume, ax):
         """Plot trading volume by sentiment."""
-        sentiment_volume = data.groupby('classification')['Size USD'].sum()
         if len(sentiment_volume) > 0:
             sentiment_volume.plot(kind='bar', ax=ax, color='blue', alpha=0.7)
             ax.set_title('Total Trading Volume by Sentiment')
@@ -215,61 +242,65 @@ class SentimentVisualizer:
             ax.tick_params(axis='x', rotation=45)
             
             # Add value labels
-            for i, v in enumerate(sentiment_volume.values):
-                ax.text(i, v + (max(sentiment_volume.values) * 0.01), 
-                       format_currency(v), ha='center', va='bottom')
+            ax.bar_label(ax.containers[-1], labels=sentiment_volume.map(format_currency).tolist(),
+                        padding=3)
         else:
             ax.text(0.5, 0.5, 'No data available', ha='center', va='center', transform=ax.transAxes)
     
-    def _plot_win_rate_by_sentiment(self, data, ax):
+    def _plot_win_rate_by_sentiment(self, win_rates, ax):
         """Plot win rate by sentiment."""
-        win_rates = data.groupby('classification').apply(
-            lambda x: (x['Closed PnL'] > 0).sum() / len(x) * 100
-        )
         if len(win_rates) > 0:
-            colors = [get_sentiment_color(sentiment) for sentiment in win_rates.index]
+            colors = get_sentiment_colors(win_rates.index)
             win_rates.plot(kind='bar', ax=ax, color=colors, alpha=0.7)
             ax.set_title('Win Rate by Sentiment')
             ax.set_ylabel('Win Rate (%)')
             ax.tick_params(axis='x', rotation=45)
             
             # Add value labels
-            for i, v in enumerate(win_rates.values):
-                ax.text(i, v + 1, format_percentage(v), ha='center', va='bottom')
+            ax.bar_label(ax.containers[-1], labels=win_rates.map(format_percentage).tolist(),
+                        padding=3)
         else:
             ax.text(0.5, 0.5, 'No data available', ha='center', va='center', transform=ax.transAxes)
     
     def _plot_pnl_vs_sentiment_scatter(self, data, ax):
         """Plot PnL vs sentiment scatter plot."""
         if len(data) > 0:
-            scatter_colors = {
-                'Fear': 'red', 
-                'Extreme Fear': 'darkred', 
-                'Greed': 'green', 
-                'Extreme Greed': 'darkgreen',
-                'Neutral': 'gray'
-            }
+            # Large datasets are sampled; drawing time grows with every point
+            plot_data = data
+            if len(data) > SCATTER_MAX_POINTS:
+                plot_data = data.sample(SCATTER_MAX_POINTS, random_state=0)
+            
+            # Draw every point in one call, colored by a per-row color array
+            colors = get_sentiment_colors(plot_data['classification'])
+            ax.scatter(plot_data['value'].to_numpy(), plot_data['Closed PnL'].to_numpy(),
+                      c=colors, alpha=0.6)
             
-            for sentiment in data['classification'].unique():
-                subset = data[data['classification'] == sentiment]
-                ax.scatter(subset['value'], subset['Closed PnL'], 
-                          label=sentiment, alpha=0.6, 
-                          color=scatter_colors.get(sentiment, 'gray'))
+            sentiments = data['classification'].dropna().unique()
+            if isinstance(sentiments, pd.Categorical):
+                sentiments = sentiments.sort_values()
+            handles = [
+                Line2D([0], [0], marker='o', linestyle='', alpha=0.6,
+                       color=get_sentiment_color(sentiment), label=sentiment)
+                for sentiment in sentiments
+            ]
             
             ax.set_title('PnL vs Fear/Greed Index')
             ax.set_xlabel('Fear/Greed Index')
             ax.set_ylabel('Closed PnL ($)')
-            ax.legend()
+            ax.legend(handles=handles)
         else:
             ax.text(0.5, 0.5, 'No data available', ha='center', va='center', transform=ax.transAxes)
     
-    def create_time_series_analysis(self, merged_data, save_name='time_series_analysis'):
+    def create_time_series_analysis(self, merged_data, save_name='time_series_analysis',
+                                    close_after_save=True):
         """
         Create time series analysis visualizations.
         
         Args:
             merged_data (pd.DataFrame): Merged dataset
             save_name (str): Name for saved file
+            close_after_save (bool): Close the figure once saved so repeated
+                calls do not accumulate open figures
         """
         if merged_data is None or len(merged_data) == 0:
             print("Error: No data available for time series visualization")
@@ -281,27 +312,27 @@ class SentimentVisualizer:
         fig.suptitle('Time Series Analysis', fontsize=16, fontweight='bold')
         
         # Daily aggregation
-        daily_data = merged_data.groupby('date').agg({
-            'Closed PnL': 'sum',
-            'Size USD': 'sum',
-            'value': 'mean',
-            'classification': 'first'
-        }).reset_index()
+        daily_data = merged_data.groupby('date').agg(
+            pnl=('Closed PnL', 'sum'),
+            volume=('Size USD', 'sum'),
+            value=('value', 'mean')
+        )
+        dates = daily_data.index
         
         # 1. Daily PnL
-        axes[0].plot(daily_data['date'], daily_data['Closed PnL'], marker='o', linewidth=2)
+        axes[0].plot(dates, daily_data['pnl'], marker='o', linewidth=2)
         axes[0].set_title('Daily PnL Over Time')
         axes[0].set_ylabel('Daily PnL ($)')
         axes[0].grid(True, alpha=0.3)
         
         # 2. Daily Volume
-        axes[1].bar(daily_data['date'], daily_data['Size USD'], alpha=0.7, color='blue')
+        axes[1].bar(dates, daily_data['volume'], alpha=0.7, color='blue')
         axes[1].set_title('Daily Trading Volume Over Time')
         axes[1].set_ylabel('Daily Volume ($)')
         axes[1].grid(True, alpha=0.3)
         
         # 3. Fear/Greed Index
-        axes[2].plot(daily_data['date'], daily_data['value'], marker='s', 
+        axes[2].plot(dates, daily_data['value'], marker='s', 
                     linewidth=2, color='purple')
         axes[2].set_title('Fear/Greed Index Over Time')
         axes[2].set_ylabel('Fear/Greed Index')
@@ -312,7 +343,9 @@ class SentimentVisualizer:
         
         # Save the plot
         save_path = f"{self.output_dir}/{save_name}.png"
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
+        plt.savefig(save_path, dpi=150)
         print(f"Time series analysis saved as '{save_path}'")
+        if close_after_save:
+            plt.close(fig)
         
         return fig
\ No newline at end of file